@@ -1,6 +1,32 @@
 from django.contrib import admin
 from .models import Question, Choice
-import jdatetime
+import datetime
+import functools
+from django.conf import settings
+from django.db.models import BooleanField, ExpressionWrapper, Q
+from django.utils import timezone
+
+
+@functools.lru_cache(maxsize=4096)
+def _jalali_fmt(date, fast):
+    """
+    Format a Gregorian date as a Jalali "YYYY/MM/DD" string (memoized).
+    `fast` selects the jalali_core path and is part of the cache key.
+    """
+    # The calendar modules are imported here rather than at module level so
+    # that only processes that actually render the changelist pay for them.
+    if fast:
+        import jalali_core
+
+        # Call jdatetime's conversion routine directly, skipping the
+        # jdatetime.date construction and strftime machinery.
+        converter = jalali_core.GregorianToJalali(date.year, date.month, date.day)
+        return "%04d/%02d/%02d" % converter.getJalaliList()
+    import jdatetime
+
+    jalali_date = jdatetime.date.fromgregorian(date=date)
+    return f"{jalali_date.year:04d}/{jalali_date.month:02d}/{jalali_date.day:02d}"
+
 
 class ChoiceInline(admin.TabularInline):
     model = Choice
@@ -15,18 +41,42 @@ class QuestionAdmin(admin.ModelAdmin):
     ]
     inlines = [ChoiceInline]
 
-    list_display = ["question_text", "get_jalali_pub_date", "was_published_recently"]
+    list_display = ["question_text", "get_jalali_pub_date", "was_published_recently_display"]
     list_filter = ["pub_date"]
+    date_hierarchy = "pub_date"
     search_fields = ["question_text"]
     ordering = ["-pub_date"]  # New: Order by publication date descending
+    list_display_links = ["question_text"]
+    show_full_result_count = False  # Skip the extra unfiltered COUNT(*)
+
+    def get_queryset(self, request):
+        """Compute the "published recently" flag in SQL instead of per row."""
+        now = timezone.now()
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(
+                _recent=ExpressionWrapper(
+                    Q(pub_date__gte=now - datetime.timedelta(days=1)) & Q(pub_date__lte=now),
+                    output_field=BooleanField(),
+                )
+            )
+        )
 
     def get_jalali_pub_date(self, obj):
         """Convert publication date to Jalali format."""
-        jalali_date = jdatetime.datetime.fromgregorian(datetime=obj.pub_date)
-        return jalali_date.strftime("%Y/%m/%d")
+        return _jalali_fmt(obj.pub_date.date(), getattr(settings, "POLLS_FAST_JALALI", True))
 
     get_jalali_pub_date.short_description = "Publication date (شمسی)"
 
+    def was_published_recently_display(self, obj):
+        """Read the flag annotated by get_queryset()."""
+        return obj._recent
+
+    was_published_recently_display.short_description = "Published recently?"
+    was_published_recently_display.boolean = True
+    was_published_recently_display.admin_order_field = "pub_date"
+
     def has_add_permission(self, request):
         """Prevent adding new questions directly from admin."""
         return False
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-14 07:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('polls', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='question',
+            options={'ordering': ['-pub_date']},
+        ),
+        migrations.AddIndex(
+            model_name='question',
+            index=models.Index(fields=['-pub_date'], name='question_pub_date_desc_idx'),
+        ),
+    ]
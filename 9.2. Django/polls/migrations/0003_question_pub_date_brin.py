@@ -0,0 +1,28 @@
+from django.db import migrations
+
+
+def create_brin_index(apps, schema_editor):
+    # BRIN indexes are PostgreSQL-only; other backends rely on the B-tree
+    # index from 0002.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS q_pub_brin_idx ON polls_question USING BRIN (pub_date)"
+    )
+
+
+def drop_brin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS q_pub_brin_idx")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('polls', '0002_alter_question_options_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_brin_index, drop_brin_index),
+    ]
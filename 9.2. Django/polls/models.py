@@ -1,34 +1,66 @@
 import datetime
 from django.db import models
+from django.db.models import DurationField, ExpressionWrapper, F
+from django.db.models.functions import Now
 from django.utils import timezone
 
+_ONE_DAY = datetime.timedelta(days=1)
+
 # Create your models here.
+class QuestionQuerySet(models.QuerySet):
+    def with_days_since(self):
+        """
+        Annotates each question with `days_since`, the time elapsed since
+        publication, computed by the database.
+        """
+        return self.annotate(
+            days_since=ExpressionWrapper(Now() - F("pub_date"), output_field=DurationField())
+        )
+
+
 class Question(models.Model):
     question_text = models.CharField(max_length=200)
     pub_date = models.DateTimeField("date published")
 
+    objects = QuestionQuerySet.as_manager()
+
+    class Meta:
+        ordering = ["-pub_date"]
+        indexes = [
+            models.Index(fields=["-pub_date"], name="question_pub_date_desc_idx"),
+        ]
+
     def __str__(self):
         return self.question_text
 
-    def was_published_recently(self):
+    def was_published_recently(self, now=None):
         """
         Returns True if the question was published within the last day.
+        Pass `now` to reuse a single timestamp across many questions.
         """
-        now = timezone.now()
-        return now - datetime.timedelta(days=1) <= self.pub_date <= now
+        if now is None:
+            now = timezone.now()
+        return now - _ONE_DAY <= self.pub_date <= now
 
-    def is_published(self):
+    def is_published(self, now=None):
         """
         Returns True if the question has been published.
         """
-        return self.pub_date <= timezone.now()
+        if now is None:
+            now = timezone.now()
+        return self.pub_date <= now
 
-    def days_since_publication(self):
+    def days_since_publication(self, now=None):
         """
         Returns the number of days since the question was published.
+        Uses the `days_since` annotation from with_days_since() when present.
         """
+        if now is None and getattr(self, "days_since", None) is not None:
+            return self.days_since.days
         if self.pub_date:
-            return (timezone.now() - self.pub_date).days
+            if now is None:
+                now = timezone.now()
+            return (now - self.pub_date).days
         return None
 
 class Choice(models.Model):
@@ -41,14 +73,31 @@ class Choice(models.Model):
 
     def increment_votes(self):
         """
-        Increments the vote count for this choice.
+        Increments the vote count for this choice, saving it first if it
+        has not been saved yet.
         """
+        if self._state.adding:
+            self.votes += 1
+            self.save()
+            return
+        type(self).objects.filter(pk=self.pk).update(votes=F("votes") + 1)
         self.votes += 1
-        self.save()
 
     def reset_votes(self):
         """
-        Resets the vote count for this choice to zero.
+        Resets the vote count for this choice to zero, saving it first if it
+        has not been saved yet.
         """
         self.votes = 0
-        self.save()
\ No newline at end of file
+        if self._state.adding:
+            self.save()
+            return
+        type(self).objects.filter(pk=self.pk).update(votes=0)
+
+    @classmethod
+    def reset_all_for_question(cls, question_id):
+        """
+        Resets the vote count of every choice of the given question to zero
+        in a single UPDATE. Returns the number of choices reset.
+        """
+        return cls.objects.filter(question_id=question_id).update(votes=0)
\ No newline at end of file
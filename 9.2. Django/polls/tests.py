@@ -1,9 +1,13 @@
 import datetime
 
-from django.test import TestCase
+from django.contrib.admin.sites import AdminSite
+from django.contrib.auth.models import User
+from django.db import IntegrityError
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
 from django.utils import timezone
+from .admin import QuestionAdmin, _jalali_fmt
 from .models import Question, Choice
-from django.urls import reverse
 
 def create_question(question_text, days):
     """
@@ -20,7 +24,8 @@ class QuestionIndexViewTests(TestCase):
         """
         If no questions exist, an appropriate message is displayed.
         """
-        response = self.client.get(reverse("polls:index"))
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("polls:index"))
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "No polls are available.")
         self.assertQuerySetEqual(response.context["latest_question_list"], [])
@@ -31,7 +36,8 @@ class QuestionIndexViewTests(TestCase):
         index page.
         """
         question = create_question(question_text="Past question.", days=-30)
-        response = self.client.get(reverse("polls:index"))
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("polls:index"))
         self.assertQuerySetEqual(
             response.context["latest_question_list"],
             [question],
@@ -43,7 +49,8 @@ class QuestionIndexViewTests(TestCase):
         the index page.
         """
         create_question(question_text="Future question.", days=30)
-        response = self.client.get(reverse("polls:index"))
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("polls:index"))
         self.assertContains(response, "No polls are available.")
         self.assertQuerySetEqual(response.context["latest_question_list"], [])
 
@@ -54,7 +61,8 @@ class QuestionIndexViewTests(TestCase):
         """
         question = create_question(question_text="Past question.", days=-30)
         create_question(question_text="Future question.", days=30)
-        response = self.client.get(reverse("polls:index"))
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("polls:index"))
         self.assertQuerySetEqual(
             response.context["latest_question_list"],
             [question],
@@ -66,7 +74,8 @@ class QuestionIndexViewTests(TestCase):
         """
         question1 = create_question(question_text="Past question 1.", days=-30)
         question2 = create_question(question_text="Past question 2.", days=-5)
-        response = self.client.get(reverse("polls:index"))
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("polls:index"))
         self.assertQuerySetEqual(
             response.context["latest_question_list"],
             [question2, question1],
@@ -80,7 +89,8 @@ class QuestionDetailViewTests(TestCase):
         """
         future_question = create_question(question_text="Future question.", days=5)
         url = reverse("polls:detail", args=(future_question.id,))
-        response = self.client.get(url)
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
         self.assertEqual(response.status_code, 404)
 
     def test_past_question(self):
@@ -90,7 +100,8 @@ class QuestionDetailViewTests(TestCase):
         """
         past_question = create_question(question_text="Past Question.", days=-5)
         url = reverse("polls:detail", args=(past_question.id,))
-        response = self.client.get(url)
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
         self.assertContains(response, past_question.question_text)
 
 class QuestionModelTests(TestCase):
@@ -141,6 +152,10 @@ class QuestionModelTests(TestCase):
     #     with self.assertRaises(ValueError):
     #         Question(pub_date=None)
 
+    def test_save_without_pub_date(self):
+        with self.assertRaises(IntegrityError):
+            Question.objects.create(question_text="Undated question.", pub_date=None)
+
     def test_str_representation(self):
         question = Question(question_text="Sample Question", pub_date=timezone.now())
         self.assertEqual(str(question), "Sample Question")
@@ -160,13 +175,30 @@ class QuestionModelTests(TestCase):
         question = Question(pub_date=time)
         self.assertEqual(question.days_since_publication(), 5)
 
+    def test_methods_share_given_now(self):
+        now = timezone.now()
+        question = Question(pub_date=now - datetime.timedelta(days=3))
+        later = now + datetime.timedelta(days=10)
+        self.assertIs(question.was_published_recently(now=later), False)
+        self.assertIs(question.is_published(now=later), True)
+        self.assertEqual(question.days_since_publication(now=later), 13)
+
+    def test_days_since_publication_with_annotation(self):
+        # Keep clear of the day boundary: SQLite's Now() has second precision.
+        time = timezone.now() - datetime.timedelta(days=5, hours=1)
+        question = Question.objects.create(question_text="Old question.", pub_date=time)
+        annotated = Question.objects.with_days_since().get(pk=question.pk)
+        self.assertEqual(annotated.days_since.days, 5)
+        self.assertEqual(annotated.days_since_publication(), 5)
+
     def test_days_since_publication_with_no_pub_date(self):
         question = Question(pub_date=None)
         self.assertIsNone(question.days_since_publication())
 
 class ChoiceModelTests(TestCase):
-    def setUp(self):
-        self.question = Question.objects.create(question_text="Sample Question", pub_date=timezone.now())
+    @classmethod
+    def setUpTestData(cls):
+        cls.question = Question.objects.create(question_text="Sample Question", pub_date=timezone.now())
 
     def test_str_representation(self):
         choice = Choice(question=self.question, choice_text="Choice A")
@@ -177,12 +209,40 @@ class ChoiceModelTests(TestCase):
         choice.save()
         choice.increment_votes()
         self.assertEqual(choice.votes, 1)
+        choice.refresh_from_db()
+        self.assertEqual(choice.votes, 1)
 
     def test_reset_votes(self):
         choice = Choice(question=self.question, choice_text="Choice A", votes=5)
         choice.save()
         choice.reset_votes()
         self.assertEqual(choice.votes, 0)
+        choice.refresh_from_db()
+        self.assertEqual(choice.votes, 0)
+
+    def test_increment_votes_on_unsaved_choice(self):
+        choice = Choice(question=self.question, choice_text="Choice A")
+        choice.increment_votes()
+        self.assertIsNotNone(choice.pk)
+        self.assertEqual(Choice.objects.get(pk=choice.pk).votes, 1)
+
+    def test_reset_votes_on_unsaved_choice(self):
+        choice = Choice(question=self.question, choice_text="Choice A", votes=5)
+        choice.reset_votes()
+        self.assertIsNotNone(choice.pk)
+        self.assertEqual(Choice.objects.get(pk=choice.pk).votes, 0)
+
+    def test_reset_all_for_question(self):
+        Choice.objects.bulk_create([
+            Choice(question=self.question, choice_text="Choice A", votes=3),
+            Choice(question=self.question, choice_text="Choice B", votes=7),
+        ])
+        self.assertEqual(Choice.reset_all_for_question(self.question.id), 2)
+        self.assertQuerySetEqual(
+            Choice.objects.filter(question=self.question).values_list("votes", flat=True),
+            [0, 0],
+            ordered=False,
+        )
 
     def test_choice_belongs_to_question(self):
         choice = Choice(question=self.question, choice_text="Choice A")
@@ -191,4 +251,56 @@ class ChoiceModelTests(TestCase):
 
     def test_choice_votes_default(self):
         choice = Choice(question=self.question, choice_text="Choice A")
-        self.assertEqual(choice.votes, 0)
\ No newline at end of file
+        self.assertEqual(choice.votes, 0)
+
+class QuestionAdminTests(TestCase):
+    def setUp(self):
+        self.admin = QuestionAdmin(Question, AdminSite())
+        self.request = RequestFactory().get("/admin/polls/question/")
+
+    def test_was_published_recently_display(self):
+        recent = create_question(question_text="Recent question.", days=0)
+        old = create_question(question_text="Old question.", days=-2)
+        future = create_question(question_text="Future question.", days=2)
+        queryset = self.admin.get_queryset(self.request)
+        self.assertIs(self.admin.was_published_recently_display(queryset.get(pk=recent.pk)), True)
+        self.assertIs(self.admin.was_published_recently_display(queryset.get(pk=old.pk)), False)
+        self.assertIs(self.admin.was_published_recently_display(queryset.get(pk=future.pk)), False)
+
+    def test_get_jalali_pub_date(self):
+        question = Question(pub_date=datetime.datetime(2025, 1, 3, 17, 38, tzinfo=datetime.timezone.utc))
+        self.assertEqual(self.admin.get_jalali_pub_date(question), "1403/10/14")
+
+    def test_jalali_fmt_fast_path_matches_jdatetime(self):
+        day = datetime.date(1990, 1, 1)
+        while day.year < 2030:
+            self.assertEqual(_jalali_fmt(day, True), _jalali_fmt(day, False))
+            day += datetime.timedelta(days=37)
+
+    def test_get_jalali_pub_date_follows_setting(self):
+        question = Question(pub_date=datetime.datetime(2025, 1, 3, 17, 38, tzinfo=datetime.timezone.utc))
+        _jalali_fmt.cache_clear()
+        self.admin.get_jalali_pub_date(question)
+        with override_settings(POLLS_FAST_JALALI=False):
+            self.assertEqual(self.admin.get_jalali_pub_date(question), "1403/10/14")
+        # Each setting value gets its own cache entry.
+        self.assertEqual(_jalali_fmt.cache_info().misses, 2)
+
+    def test_changelist_query_count(self):
+        """
+        The changelist issues the same number of queries whether it lists
+        one question or several, each with choices.
+        """
+        self.client.force_login(User.objects.create_superuser("admin", "admin@example.com", "password"))
+        url = reverse("admin:polls_question_changelist")
+        created = 0
+        for total in (1, 5):
+            with self.subTest(questions=total):
+                for i in range(created, total):
+                    question = create_question(question_text=f"Question {i}.", days=-i)
+                    Choice.objects.bulk_create([Choice(question=question, choice_text=f"C{j}") for j in range(3)])
+                created = total
+                with self.assertNumQueries(6):
+                    response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(len(response.context["cl"].result_list), total)
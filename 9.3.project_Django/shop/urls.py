@@ -1,7 +1,7 @@
 from . import views
 from django.urls import path
 
-urlpatterns = [
+urlpatterns = (
     path('', views.index, name='index'),
     #path('products/', views.products, name='products'),
     #path('categories/', views.categories, name='categories'),
@@ -11,5 +11,4 @@ urlpatterns = [
     path('signin/', views.signin, name='signin'),
     path('signout/', views.signout, name='signout'),
     path('profile/', views.profile, name='profile'),
-
-]
\ No newline at end of file
+)
\ No newline at end of file